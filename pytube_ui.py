@@ -1,9 +1,23 @@
 import os
+import sys
 import json
+import hashlib
+import traceback
+import faulthandler
+import socket
 import platform
-
-from http.client import RemoteDisconnected
-
+import time
+import itertools
+import threading
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.resource_tracker
+
+from http.client import RemoteDisconnected, HTTPException
+from urllib.error import URLError, HTTPError
+from multiprocessing.connection import Connection
+
+import msgpack
 import pytube
 
 from rich.text import Text
@@ -12,6 +26,7 @@ from rich.console import RenderableType
 from textual import on
 from textual import work
 from textual.worker import Worker
+from textual.css.query import NoMatches
 from textual.app import App, ComposeResult
 from textual.containers import VerticalScroll, Center
 from textual.widgets import (
@@ -19,7 +34,8 @@ from textual.widgets import (
     Static, Input, ProgressBar, Label, Select
 )
 
-from typing import Type
+from typing import Type, Callable
+from collections import deque
 from collections.abc import Iterable
 
 
@@ -98,6 +114,13 @@ class Settings:
             "mp4_default": "128kbps",
             "webm_default": "128kbps"
         },
+        "execution": {
+            "values": [
+                "Threads",
+                "Processes"
+            ],
+            "default": "Threads"
+        },
     }
 
     def __init__(self, path: str) -> None:
@@ -112,6 +135,17 @@ class Settings:
 
         self._set_values(self._data)
 
+    @classmethod
+    def from_values(cls, data: dict) -> "Settings":
+        # Used by the download processes, which receive a snapshot of the
+        #     settings instead of reading the file.
+        settings = cls.__new__(cls)
+        settings.path = None
+        settings._data = data
+        settings._set_values(data)
+
+        return settings
+
     def save(self) -> None:
         print(f"Settings.save\"({self.path}\", {self._get_values()})")
 
@@ -126,6 +160,12 @@ class Settings:
         with open(path, "r") as file:
             data = json.loads(file.read())
 
+        # Settings files written before the execution mode was introduced
+        data.setdefault(
+            "execution_mode",
+            self.SELECT_VALUES["execution"]["default"]
+        )
+
         self._validate(data)
 
         return data
@@ -139,7 +179,8 @@ class Settings:
                 ("content_format"     in data),
                 ("video_resolution"   in data),
                 ("mp4_audio_bitrate"  in data),
-                ("webm_audio_bitrate" in data)
+                ("webm_audio_bitrate" in data),
+                ("execution_mode"     in data)
             )
         ):
             raise KeyError()
@@ -152,7 +193,8 @@ class Settings:
                 isinstance(data["content_format"],     str),
                 isinstance(data["video_resolution"],   str),
                 isinstance(data["mp4_audio_bitrate"],  str),
-                isinstance(data["webm_audio_bitrate"], str)
+                isinstance(data["webm_audio_bitrate"], str),
+                isinstance(data["execution_mode"],     str)
             )
         ):
             raise TypeError()
@@ -162,7 +204,8 @@ class Settings:
                 (data["content_format"]     in self.SELECT_VALUES["format"]["values"]),
                 (data["video_resolution"]   in self.SELECT_VALUES["resolution"]["values"]),
                 (data["mp4_audio_bitrate"]  in self.SELECT_VALUES["bitrate"]["mp4_values"]),
-                (data["webm_audio_bitrate"] in self.SELECT_VALUES["bitrate"]["webm_values"])
+                (data["webm_audio_bitrate"] in self.SELECT_VALUES["bitrate"]["webm_values"]),
+                (data["execution_mode"]     in self.SELECT_VALUES["execution"]["values"])
             )
         ):
             raise ValueError()
@@ -179,6 +222,7 @@ class Settings:
             "video_resolution":   data["resolution"]["default"],
             "mp4_audio_bitrate":  data["bitrate"]["mp4_default"],
             "webm_audio_bitrate": data["bitrate"]["webm_default"],
+            "execution_mode":     data["execution"]["default"],
         }
 
     @staticmethod
@@ -214,6 +258,7 @@ class Settings:
         self.video_resolution   = data["video_resolution"]
         self.mp4_audio_bitrate  = data["mp4_audio_bitrate"]
         self.webm_audio_bitrate = data["webm_audio_bitrate"]
+        self.execution_mode     = data["execution_mode"]
 
     def _get_values(self) -> dict:
         return {
@@ -224,13 +269,85 @@ class Settings:
             "video_resolution":   self.video_resolution,
             "mp4_audio_bitrate":  self.mp4_audio_bitrate,
             "webm_audio_bitrate": self.webm_audio_bitrate,
+            "execution_mode":     self.execution_mode,
         }
 
 
+class IntegrityError(Exception):
+    pass
+
+
+class ResumeError(Exception):
+    pass
+
+
+class StreamChecksum:
+    """Hashes a stream while it is downloaded and verifies its size.
+
+    The digest is written to a sidecar file in the `sha256sum` format.
+    """
+
+    ALGORITHM = "sha256"
+
+    def __init__(self, expected_size: int) -> None:
+        self.expected_size = expected_size
+        self.size = 0
+        self._hash = hashlib.new(self.ALGORITHM)
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+
+        if self.size > self.expected_size:
+            # Fail fast, the stream does not match its manifest
+            raise IntegrityError(
+                f"Received {self.size} bytes, expected {self.expected_size}"
+            )
+
+        self._hash.update(chunk)
+
+    def verify(self, path: str) -> None:
+        if self.size != self.expected_size:
+            raise IntegrityError(
+                f"Received {self.size} bytes, expected {self.expected_size}"
+            )
+
+        if os.path.getsize(path) != self.expected_size:
+            raise IntegrityError(
+                f"\"{path}\" does not match the received {self.size} bytes"
+            )
+
+    def write_sidecar(self, path: str) -> None:
+        with open(self.sidecar_path(path), "w") as file:
+            file.write(f"{self._hash.hexdigest()}  {os.path.basename(path)}\n")
+
+    @classmethod
+    def sidecar_path(cls, path: str) -> str:
+        return f"{path}.{cls.ALGORITHM}"
+
+
 class YouTubeVideoDownloader:
-    def __init__(self, widget: Static, URL: str) -> None:
+    # Errors after which the missing part of a stream is fetched again
+    TRANSFER_ERRORS = (
+        URLError,
+        ConnectionError,
+        socket.timeout,
+        HTTPException,
+        pytube.exceptions.MaxRetriesExceeded
+    )
+    TRANSFER_TIMEOUT = 30
+    RANGE_RETRIES = 3
+    RANGE_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        widget: Static,
+        URL: str,
+        settings: Settings | None = None
+    ) -> None:
         self.widget = widget
         self.URL = URL
+        # A download process runs several jobs, each with its own settings
+        self.settings = SETTINGS if settings is None else settings
         self.downloader = self.create_downloader(URL=URL)
 
         if self.downloader is not None:
@@ -251,6 +368,13 @@ class YouTubeVideoDownloader:
         self,
         error: Type[pytube.exceptions.PytubeError | Exception]
     ) -> None:
+        if isinstance(error, JobCancelled):
+            # Nobody is waiting for the feedback
+            return None
+
+        # Written to the log file in a download process
+        traceback.print_exception(error)
+
         if isinstance(error, pytube.exceptions.MaxRetriesExceeded):
             error_feedback = "Maximum number of retries exceeded. Please check your Internet connection and try again."
 
@@ -278,17 +402,28 @@ class YouTubeVideoDownloader:
         elif isinstance(error, pytube.exceptions.VideoRegionBlocked):
             error_feedback = "The video is not available in your region."
 
+        elif isinstance(error, IntegrityError):
+            error_feedback = "The downloaded file is damaged. Please try again."
+
+        elif isinstance(error, ResumeError):
+            error_feedback = "The download was interrupted and cannot be resumed. Please try again."
+
         else:
             error_feedback = "Sorry, something went wrong. Please check your Internet connection and try again."
 
+        self._call_widget(self.widget.output_error_feedback, error_feedback)
+
+    def _call_widget(self, callback: Callable, *args) -> None:
+        if isinstance(self.widget, ProcessWidget):
+            # There is no UI thread in a download process
+            callback(*args)
+            return None
+
         try:
-            APP.call_from_thread(
-                self.widget.output_error_feedback,
-                error_feedback
-            )
+            APP.call_from_thread(callback, *args)
         except RuntimeError:
-            self.widget.output_error_feedback(text=error_feedback)
-
+            # Called from the UI thread
+            callback(*args)
 
     def download(self) -> None:
         try:
@@ -298,20 +433,20 @@ class YouTubeVideoDownloader:
             self._handle_error(error=error)
             return None
 
-        streams = streams.filter(subtype=SETTINGS.content_format)
+        streams = streams.filter(subtype=self.settings.content_format)
 
         downloaded_data = 0
         total_data = 0
 
         # Select the video stream
-        if SETTINGS.download_video:
+        if self.settings.download_video:
             video_stream, total_data = self._get_video_stream(
                 streams,
                 total_data
             )
 
         # Select the audio stream
-        if SETTINGS.download_audio:
+        if self.settings.download_audio:
             audio_stream, total_data = self._get_audio_stream(
                 streams,
                 total_data
@@ -320,21 +455,26 @@ class YouTubeVideoDownloader:
         # Start the ProgressBar
         self.widget.start_downloading()
 
-        # Download the video stream
-        if SETTINGS.download_video:
-            video_path, downloaded_data = self._download_video_stream(
-                video_stream,
-                downloaded_data,
-                total_data
-            )
+        try:
+            # Download the video stream
+            if self.settings.download_video:
+                video_path, downloaded_data = self._download_video_stream(
+                    video_stream,
+                    downloaded_data,
+                    total_data
+                )
 
-        # Download the audio stream
-        if SETTINGS.download_audio:
-            audio_path, downloaded_data = self._download_audio_stream(
-                audio_stream,
-                downloaded_data,
-                total_data
-            )
+            # Download the audio stream
+            if self.settings.download_audio:
+                audio_path, downloaded_data = self._download_audio_stream(
+                    audio_stream,
+                    downloaded_data,
+                    total_data
+                )
+
+        except Exception as error:
+            self._handle_error(error=error)
+            return None
 
         # Merge the audio and video if needed
         ...    # TODO
@@ -344,46 +484,142 @@ class YouTubeVideoDownloader:
         stream: pytube.Stream,
         bytes_received: int,
         bytes_total: int
-    ) -> None:
-        def on_complete(
-            stream: pytube.Stream,
-            file_path: str
-        ) -> None:
-            video = SETTINGS.download_video
-            audio = SETTINGS.download_audio
-            bytes = bool(bytes_received)
-
-            if not ((video & audio) ^ bytes):
-                # Called only if the current stream is the last one
-                APP.call_from_thread(
-                    self.widget.set_progress,
-                    self.widget.PROGRESS_STEPS
-                )
+    ) -> str:
+        checksum = StreamChecksum(expected_size=stream.filesize)
 
         def on_progress(
             stream: pytube.Stream,
             chunk: bytes,
             bytes_remaining: int
         ) -> None:
+            # The chunk is already written, hash it while it is in memory
+            checksum.update(chunk)
+
             bytes_progress = bytes_received + (stream.filesize - bytes_remaining)
             progress_percentage = int(
                 self.widget.PROGRESS_STEPS * (bytes_progress / bytes_total)
             )
 
-            APP.call_from_thread(
+            self._call_widget(
                 self.widget.set_progress,
                 progress_percentage
             )
 
-        self.downloader.register_on_complete_callback(on_complete)
         self.downloader.register_on_progress_callback(on_progress)
 
         filename_prefix: str = f"({stream.type}) " * stream.is_adaptive
 
-        stream.download(
-            output_path=SETTINGS.output_directory,
+        file_path = stream.get_file_path(
+            output_path=self.settings.output_directory,
             filename_prefix=filename_prefix
         )
+        sidecar_path = StreamChecksum.sidecar_path(file_path)
+
+        # Only a file verified by an earlier download is skipped
+        if os.path.isfile(sidecar_path) and stream.exists_at_path(file_path):
+            self._complete_stream(bytes_received)
+            return file_path
+
+        if os.path.isfile(sidecar_path):
+            os.remove(sidecar_path)
+
+        try:
+            stream.download(
+                output_path=self.settings.output_directory,
+                filename_prefix=filename_prefix,
+                skip_existing=False,
+                timeout=self.TRANSFER_TIMEOUT
+            )
+        except self.TRANSFER_ERRORS:
+            # Everything hashed so far is on disk, resume after it
+            pass
+
+        self._fetch_missing_range(stream, file_path, checksum, on_progress)
+
+        checksum.verify(file_path)
+        checksum.write_sidecar(file_path)
+
+        self._complete_stream(bytes_received)
+
+        return file_path
+
+    def _fetch_missing_range(
+        self,
+        stream: pytube.Stream,
+        file_path: str,
+        checksum: StreamChecksum,
+        on_progress: Callable
+    ) -> None:
+        failures = 0
+
+        while checksum.size < stream.filesize:
+            # Bounded ranges, like pytube, as large ones get throttled
+            start = checksum.size
+            stop = min(
+                start + pytube.request.default_range_size,
+                stream.filesize
+            ) - 1
+            error = None
+
+            try:
+                response = pytube.request._execute_request(
+                    stream.url + f"&range={start}-{stop}",
+                    method="GET",
+                    timeout=self.TRANSFER_TIMEOUT
+                )
+
+                # Nothing of the stream may be on disk yet
+                mode = "r+b" if start else "wb"
+
+                with open(file_path, mode) as file:
+                    # Drop the bytes of a failed write after the hashed part
+                    file.seek(start)
+                    file.truncate()
+
+                    while chunk := response.read(self.RANGE_CHUNK_SIZE):
+                        file.write(chunk)
+                        on_progress(
+                            stream,
+                            chunk,
+                            stream.filesize - (checksum.size + len(chunk))
+                        )
+
+            except self.TRANSFER_ERRORS as transfer_error:
+                if (
+                    isinstance(transfer_error, HTTPError)
+                    and (transfer_error.code == 404)
+                ):
+                    # pytube downloads this stream in numbered segments,
+                    #     which cannot be requested by range.
+                    raise ResumeError(
+                        f"Cannot resume the segmented stream at byte {start}"
+                    ) from transfer_error
+
+                error = transfer_error
+
+            if checksum.size > start:
+                failures = 0
+                continue
+
+            failures += 1
+
+            if failures >= self.RANGE_RETRIES:
+                if error is not None:
+                    raise error
+
+                raise IntegrityError(f"No data received from byte {start}")
+
+    def _complete_stream(self, bytes_received: int) -> None:
+        video = self.settings.download_video
+        audio = self.settings.download_audio
+        bytes = bool(bytes_received)
+
+        if not ((video & audio) ^ bytes):
+            # Called only if the current stream is the last one
+            self._call_widget(
+                self.widget.set_progress,
+                self.widget.PROGRESS_STEPS
+            )
 
     def _get_video_stream(
         self,
@@ -393,7 +629,7 @@ class YouTubeVideoDownloader:
         video_streams = streams.filter(type="video", adaptive=True)
         video_stream = self._get_nearest_by_resolution(
             streams=video_streams,
-            resolution=SETTINGS.video_resolution
+            resolution=self.settings.video_resolution
         )
         total_data += video_stream.filesize
 
@@ -408,9 +644,9 @@ class YouTubeVideoDownloader:
         audio_stream = self._get_nearest_by_bitrate(
             streams=audio_streams,
             bitrate=(
-                SETTINGS.mp4_audio_bitrate
-                if SETTINGS.content_format == "mp4"
-                else SETTINGS.webm_audio_bitrate
+                self.settings.mp4_audio_bitrate
+                if self.settings.content_format == "mp4"
+                else self.settings.webm_audio_bitrate
             )
         )
         total_data += audio_stream.filesize
@@ -474,6 +710,430 @@ class YouTubeVideoDownloader:
         return min(streams, key=difference)
 
 
+class JobCancelled(Exception):
+    pass
+
+
+class ProcessWidget:
+    """Stands in for a Video widget inside a download process.
+
+    Every call is packed with msgpack and sent to the DownloadPool, which
+    replays it on the real widget in the UI process.
+    """
+
+    PROGRESS_STEPS = 100
+    # Seconds between heartbeats while the percentage does not change
+    HEARTBEAT_INTERVAL = 5
+
+    def __init__(
+        self,
+        job_id: int,
+        events: Connection,
+        lock: threading.Lock
+    ) -> None:
+        self.job_id = job_id
+        self.events = events
+        self.lock = lock
+        self.cancelled = False
+        self._progress = None
+        self._sent = time.monotonic()
+
+    def download(self) -> None:
+        # The download is started by run_download_process
+        pass
+
+    def start_downloading(self) -> None:
+        self._send("start_downloading")
+
+    def output_error_feedback(self, text: str) -> None:
+        self._send("output_error_feedback", text)
+
+    def set_progress(self, value: int) -> None:
+        if self.cancelled:
+            # Stops pytube between two chunks of the stream
+            raise JobCancelled()
+
+        # pytube reports every chunk, the ProgressBar only needs the steps
+        if value != self._progress:
+            self._progress = value
+            self._send("set_progress", value)
+
+        elif time.monotonic() - self._sent >= self.HEARTBEAT_INTERVAL:
+            # A 1% step of a large video can take minutes on a slow
+            #     connection, DownloadPool must not take it for a hang.
+            self._send("heartbeat")
+
+    def finish(self) -> None:
+        self._send("finish")
+
+    def _send(self, event: str, *args) -> None:
+        if self.cancelled:
+            return None
+
+        message = msgpack.packb([self.job_id, event, args])
+
+        # The jobs of a process share the pipe
+        with self.lock:
+            self.events.send_bytes(message)
+
+        self._sent = time.monotonic()
+
+
+def run_download_process(
+    jobs: Connection,
+    events: Connection,
+    log_path: str
+) -> None:
+    # The child shares the terminal with the Textual app
+    sys.stdout = sys.stderr = open(log_path, "a", buffering=1)
+    faulthandler.enable(sys.stderr)
+
+    lock = threading.Lock()
+    widgets: dict[int, ProcessWidget] = {}
+
+    def run_job(widget: ProcessWidget, URL: str, settings: Settings) -> None:
+        downloader = YouTubeVideoDownloader(
+            widget=widget,
+            URL=URL,
+            settings=settings
+        )
+
+        if downloader.downloader is not None:
+            try:
+                downloader.download()
+            except Exception as error:
+                downloader._handle_error(error=error)
+
+        widget.finish()
+        widgets.pop(widget.job_id, None)
+
+    while True:
+        try:
+            message = msgpack.unpackb(jobs.recv_bytes())
+        except EOFError:
+            return None
+
+        # Every job runs in its own thread, like in the "Threads" mode,
+        #     so that the number of processes does not limit the number
+        #     of concurrent downloads.
+        match message:
+            case ["download", job_id, URL, settings]:
+                widget = ProcessWidget(job_id=job_id, events=events, lock=lock)
+                widgets[job_id] = widget
+
+                threading.Thread(
+                    target=run_job,
+                    args=(widget, URL, Settings.from_values(settings)),
+                    daemon=True
+                ).start()
+
+            case ["cancel", job_id]:
+                widget = widgets.pop(job_id, None)
+
+                if widget is not None:
+                    widget.cancelled = True
+
+
+class DownloadProcess:
+    def __init__(
+        self,
+        context: multiprocessing.context.BaseContext,
+        log_path: str
+    ) -> None:
+        job_reader, self.jobs = context.Pipe(duplex=False)
+        self.events, event_writer = context.Pipe(duplex=False)
+
+        # Time of the last event of every running job
+        self.active: dict[int, float] = {}
+        self.timed_out: set[int] = set()
+        self.process = context.Process(
+            target=run_download_process,
+            args=(job_reader, event_writer, log_path),
+            daemon=True
+        )
+        self.process.start()
+
+        # Only the child uses these ends
+        job_reader.close()
+        event_writer.close()
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.jobs.close()
+        self.events.close()
+
+
+class DownloadPool:
+    """Runs YouTubeVideoDownloader jobs in a pool of worker processes.
+
+    Every process runs its jobs in threads, and new jobs go to the process
+    with the fewest of them. Jobs and widget calls are exchanged as
+    msgpack messages over pipes. A listener thread forwards the calls to
+    the widgets and restarts the processes that crash or stop responding.
+    """
+
+    EVENTS = ("start_downloading", "output_error_feedback", "set_progress")
+    CRASH_FEEDBACK = "The download process stopped unexpectedly. Please try again."
+    TIMEOUT_FEEDBACK = "The download stopped responding. Please try again."
+
+    # Output and tracebacks of the processes
+    LOG_PATH = "pytube_ui_workers.log"
+
+    # Seconds without any event before a job is considered hung. pytube
+    #     calls on_progress once per 9 MiB range, and every call sends
+    #     either the progress or a heartbeat at most
+    #     ProcessWidget.HEARTBEAT_INTERVAL seconds after the last event.
+    JOB_TIMEOUT = 300
+    # Jobs are dispatched without waking the listener, so it checks the
+    #     timeouts at least this often.
+    POLL_INTERVAL = 1
+
+    def __init__(self, processes: int = min(4, os.cpu_count() or 1)) -> None:
+        # Forking a process that runs the Textual threads is not safe
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._job_ids = itertools.count()
+        self._jobs: dict[int, bytes] = {}
+        self._pending: deque[int] = deque()
+        self._widgets: dict[int, "Video"] = {}
+
+        self._workers: list[DownloadProcess] = []
+        try:
+            for _ in range(processes):
+                self._workers.append(
+                    DownloadProcess(self._context, self.LOG_PATH)
+                )
+        except (OSError, ValueError):
+            for worker in self._workers:
+                worker.stop()
+            raise
+
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
+
+    @staticmethod
+    def prepare() -> None:
+        # Has to be called before the app runs. Textual replaces
+        #     sys.stderr with an object without a file descriptor, which
+        #     the resource tracker of the spawned processes needs.
+        if os.name == "posix":
+            multiprocessing.resource_tracker.ensure_running()
+
+    def submit(self, widget: "Video", URL: str) -> int:
+        with self._lock:
+            job_id = next(self._job_ids)
+            self._widgets[job_id] = widget
+            self._jobs[job_id] = msgpack.packb(
+                ["download", job_id, URL, SETTINGS._get_values()]
+            )
+            self._pending.append(job_id)
+            self._dispatch()
+
+        return job_id
+
+    def cancel(self, job_id: int) -> None:
+        with self._lock:
+            self._widgets.pop(job_id, None)
+            self._jobs.pop(job_id, None)
+
+            if job_id in self._pending:
+                self._pending.remove(job_id)
+
+            for worker in self._workers:
+                if worker.active.pop(job_id, None) is not None:
+                    self._send(worker, msgpack.packb(["cancel", job_id]))
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+
+        for worker in workers:
+            worker.stop()
+
+    def _dispatch(self) -> None:
+        # Must be called with the lock held
+        while self._pending and self._workers:
+            job_id = self._pending.popleft()
+            worker = min(self._workers, key=lambda worker: len(worker.active))
+
+            worker.active[job_id] = time.monotonic()
+            self._send(worker, self._jobs[job_id])
+
+    @staticmethod
+    def _send(worker: DownloadProcess, message: bytes) -> None:
+        try:
+            worker.jobs.send_bytes(message)
+        except OSError:
+            # The process is dead, the listener reports its jobs
+            pass
+
+    def _listen(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    return None
+
+                waitables = {}
+                for worker in self._workers:
+                    waitables[worker.events] = worker
+                    waitables[worker.process.sentinel] = worker
+
+                deadlines = [
+                    last_event + self.JOB_TIMEOUT
+                    for worker in self._workers
+                    for last_event in worker.active.values()
+                ]
+
+            timeout = self.POLL_INTERVAL
+            if deadlines:
+                timeout = max(0, min(timeout, min(deadlines) - time.monotonic()))
+
+            try:
+                ready = multiprocessing.connection.wait(
+                    list(waitables),
+                    timeout=timeout
+                )
+            except OSError:
+                # A connection was closed by DownloadPool.close
+                continue
+
+            # Deliver the last events of a process before restarting it
+            ready.sort(key=lambda waitable: isinstance(waitable, int))
+
+            for waitable in ready:
+                worker = waitables[waitable]
+
+                if waitable is worker.events:
+                    self._receive(worker)
+                else:
+                    self._restart(worker)
+
+            self._terminate_hung()
+
+    def _terminate_hung(self) -> None:
+        now = time.monotonic()
+
+        with self._lock:
+            for worker in self._workers:
+                if worker.timed_out:
+                    # Already terminated
+                    continue
+
+                worker.timed_out = {
+                    job_id
+                    for job_id, last_event in worker.active.items()
+                    if now - last_event >= self.JOB_TIMEOUT
+                }
+
+                if worker.timed_out:
+                    # A thread cannot be stopped, so the whole process is.
+                    #     The sentinel makes the listener restart it.
+                    worker.process.terminate()
+
+    def _receive(self, worker: DownloadProcess) -> None:
+        try:
+            job_id, event, args = msgpack.unpackb(worker.events.recv_bytes())
+        except (EOFError, OSError):
+            self._restart(worker)
+            return None
+
+        with self._lock:
+            if job_id not in worker.active:
+                # The job was cancelled
+                return None
+
+            worker.active[job_id] = time.monotonic()
+
+            if event == "finish":
+                del worker.active[job_id]
+                self._jobs.pop(job_id, None)
+                self._widgets.pop(job_id, None)
+                return None
+
+            widget = self._widgets.get(job_id)
+
+        if (widget is not None) and (event in self.EVENTS):
+            self._call_widget(getattr(widget, event), *args)
+
+    def _restart(self, worker: DownloadProcess) -> None:
+        failed_widgets = []
+
+        with self._lock:
+            if self._closed or (worker not in self._workers):
+                # Already restarted
+                return None
+
+            # Taken out of the pool, so that no job is dispatched to it
+            self._workers.remove(worker)
+
+            for job_id in worker.active:
+                if worker.timed_out and (job_id not in worker.timed_out):
+                    # Only stopped together with a hung job
+                    self._pending.append(job_id)
+                    continue
+
+                widget = self._widgets.pop(job_id, None)
+                self._jobs.pop(job_id, None)
+
+                if widget is not None:
+                    failed_widgets.append(
+                        (
+                            widget,
+                            self.TIMEOUT_FEEDBACK
+                            if job_id in worker.timed_out
+                            else self.CRASH_FEEDBACK
+                        )
+                    )
+
+            self._dispatch()
+
+        # Stopping and spawning are slow, the UI thread must not wait
+        #     for them in submit and cancel.
+        worker.stop()
+
+        try:
+            replacement = DownloadProcess(self._context, self.LOG_PATH)
+        except (OSError, ValueError):
+            replacement = None
+
+        with self._lock:
+            if replacement is not None:
+                self._workers.append(replacement)
+
+            elif not self._workers:
+                # No process is left to run the queued jobs
+                for job_id in self._pending:
+                    self._jobs.pop(job_id, None)
+                    widget = self._widgets.pop(job_id, None)
+
+                    if widget is not None:
+                        failed_widgets.append((widget, self.CRASH_FEEDBACK))
+
+                self._pending.clear()
+
+            closed = self._closed
+            if not closed:
+                self._dispatch()
+
+        if closed and (replacement is not None):
+            replacement.stop()
+
+        for widget, error_feedback in failed_widgets:
+            self._call_widget(widget.output_error_feedback, error_feedback)
+
+    @staticmethod
+    def _call_widget(callback: Callable, *args) -> None:
+        try:
+            APP.call_from_thread(callback, *args)
+        except (RuntimeError, NoMatches):
+            # The app is closing or the widget was removed
+            pass
+
+
 class Video(Static):
     PROGRESS_STEPS = 100
 
@@ -502,6 +1162,7 @@ class Video(Static):
         )
 
         self.URL = URL
+        self.job_id: int | None = None
 
     def compose(self) -> ComposeResult:
         yield Input(placeholder="URL", id="URL_input")
@@ -515,6 +1176,9 @@ class Video(Static):
         if self.URL:
             self.create_downloader(URL=self.URL)
 
+    def on_unmount(self) -> None:
+        self.cancel_job()
+
     @on(Input.Submitted)
     def create_downloader(
         self,
@@ -529,10 +1193,21 @@ class Video(Static):
         text, URLs = URLs[0], URLs[1:]
 
         self.query_one("#URL_input").value = text
-        self.downloader = YouTubeVideoDownloader(
-            widget=self,
-            URL=text
-        )
+
+        # The job may have been submitted in the other execution mode
+        self.cancel_job()
+
+        pool = None
+        if SETTINGS.execution_mode == "Processes":
+            pool = APP.download_pool
+
+        if pool is not None:
+            self.job_id = pool.submit(widget=self, URL=text)
+        else:
+            self.downloader = YouTubeVideoDownloader(
+                widget=self,
+                URL=text
+            )
 
         for URL in URLs:
             APP.action_add_video(URL=URL)
@@ -543,6 +1218,11 @@ class Video(Static):
         #     a DOM node.
         self.downloader.download()
 
+    def cancel_job(self) -> None:
+        if self.job_id is not None:
+            APP.download_pool.cancel(self.job_id)
+            self.job_id = None
+
     def start_downloading(self) -> None:
         self.remove_class("error")
         self.query_one("#download_progress").update(
@@ -575,6 +1255,27 @@ class PytubeApp(App):
         ("r", "remove_videos", "Remove all videos"),
     ]
 
+    _download_pool: DownloadPool | None = None
+
+    @property
+    def download_pool(self) -> DownloadPool | None:
+        # Started on the first download, so that the "Threads" mode does
+        #     not spawn any processes.
+        if self._download_pool is None:
+            try:
+                self._download_pool = DownloadPool()
+            except (OSError, ValueError) as error:
+                # The downloads fall back to threads
+                self.log.error("Could not start the download processes:", error)
+                return None
+
+        return self._download_pool
+
+    def close_download_pool(self) -> None:
+        if self._download_pool is not None:
+            self._download_pool.close()
+            self._download_pool = None
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
@@ -628,6 +1329,14 @@ class PytubeApp(App):
                 allow_blank=False,
                 id="bitrate"
             )
+            yield Select(
+                options=Utils.values2options(
+                    SETTINGS.SELECT_VALUES["execution"]["values"]
+                ),
+                value=SETTINGS.execution_mode,
+                allow_blank=False,
+                id="execution"
+            )
 
     @on(Select.Changed)
     def update_settings(self, event: Select.Changed) -> None:
@@ -671,6 +1380,9 @@ class PytubeApp(App):
                     case "webm":
                         SETTINGS.webm_audio_bitrate = value
 
+            case "execution":
+                SETTINGS.execution_mode = value
+
 
     def action_add_video(self, URL: str = "") -> None:
         new_video = Video(URL=URL)
@@ -696,4 +1408,6 @@ class PytubeApp(App):
 if __name__ == "__main__":
     SETTINGS = Settings("settings.json")
     APP = PytubeApp()
+    DownloadPool.prepare()
     APP.run()
+    APP.close_download_pool()